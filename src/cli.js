@@ -10,6 +10,7 @@ const VaultStorage = require('./storage/vault');
 const AuditLogger = require('./services/audit');
 const RotationService = require('./services/rotation');
 const UsageMonitor = require('./services/monitoring');
+const crypto = require('./utils/crypto');
 
 // Initialize services
 const vault = new VaultStorage();
@@ -55,12 +56,16 @@ function printOutput(data, format = 'json') {
   if (format === 'json') {
     console.log(JSON.stringify(data, null, 2));
   } else if (format === 'table' && Array.isArray(data)) {
+    // Build the whole table and write it once rather than one call per row
     const headers = Object.keys(data[0] || {});
-    console.log(headers.join(' | '));
-    console.log(headers.map(() => '---').join(' | '));
-    data.forEach(row => {
-      console.log(headers.map(h => String(row[h] || '')).join(' | '));
-    });
+    const lines = [
+      headers.join(' | '),
+      headers.map(() => '---').join(' | ')
+    ];
+    for (const row of data) {
+      lines.push(headers.map(h => String(row[h] || '')).join(' | '));
+    }
+    console.log(lines.join('\n'));
   }
 }
 
@@ -462,13 +467,14 @@ program
         limit: parseInt(options.limit)
       });
 
-      console.log('=== Audit Log ===');
-      logs.forEach(log => {
-        console.log(`[${log.timestamp}] ${log.action} - ${log.success ? '✓' : '✗'}`);
-        console.log(`  Target: ${log.target}${log.targetId ? ` (${log.targetId})` : ''}`);
-        if (log.details) console.log(`  Details: ${JSON.stringify(log.details)}`);
-        console.log('');
-      });
+      const lines = ['=== Audit Log ==='];
+      for (const log of logs) {
+        lines.push(`[${log.timestamp}] ${log.action} - ${log.success ? '✓' : '✗'}`);
+        lines.push(`  Target: ${log.target}${log.targetId ? ` (${log.targetId})` : ''}`);
+        if (log.details) lines.push(`  Details: ${JSON.stringify(log.details)}`);
+        lines.push('');
+      }
+      console.log(lines.join('\n'));
     } catch (error) {
       console.error('Error:', error.message);
       process.exit(1);
@@ -481,7 +487,6 @@ program
   .description('Generate a new random API key')
   .option('-l, --length <length>', 'Key length', '32')
   .action(async (options) => {
-    const crypto = require('./utils/crypto');
     const key = crypto.generateApiKey(parseInt(options.length));
     console.log('Generated API Key:');
     console.log(key);
@@ -183,17 +183,24 @@ class AuditLogger {
 
     const logs = [];
     const content = fs.readFileSync(this.logPath, 'utf8');
-    const lines = content.split('\n').filter(line => line.trim());
 
-    for (const line of lines) {
+    // Resolve date bounds once rather than re-parsing them for every line
+    const startTime = filters.startDate ? new Date(filters.startDate).getTime() : null;
+    const endTime = filters.endDate ? new Date(filters.endDate).getTime() : null;
+
+    for (const line of content.split('\n')) {
+      if (!line) continue;
       try {
         const entry = JSON.parse(line);
         
         // Apply filters
         if (filters.action && entry.action !== filters.action) continue;
         if (filters.targetId && entry.targetId !== filters.targetId) continue;
-        if (filters.startDate && new Date(entry.timestamp) < new Date(filters.startDate)) continue;
-        if (filters.endDate && new Date(entry.timestamp) > new Date(filters.endDate)) continue;
+        if (startTime !== null || endTime !== null) {
+          const time = new Date(entry.timestamp).getTime();
+          if (startTime !== null && time < startTime) continue;
+          if (endTime !== null && time > endTime) continue;
+        }
         if (filters.success !== undefined && entry.success !== filters.success) continue;
         
         logs.push(entry);
@@ -202,8 +209,10 @@ class AuditLogger {
       }
     }
 
-    // Sort by timestamp descending (newest first)
-    logs.sort((a, b) => new Date(b.timestamp) - new Date(a.timestamp));
+    // Sort by timestamp descending (newest first). Timestamps are fixed-width
+    // ISO-8601 UTC strings, so comparing them directly orders chronologically
+    // without constructing two Dates per comparison.
+    logs.sort((a, b) => (a.timestamp < b.timestamp ? 1 : a.timestamp > b.timestamp ? -1 : 0));
 
     // Apply limit
     if (filters.limit) {
@@ -55,6 +55,10 @@ class UsageMonitor {
       unusedList: []
     };
 
+    // Cutoff for "recently used" (last 7 days), computed once for all keys
+    const sevenDaysAgo = new Date();
+    sevenDaysAgo.setDate(sevenDaysAgo.getDate() - 7);
+
     for (const key of keys) {
       summary.totalUsage += key.usageCount || 0;
       
@@ -63,14 +67,15 @@ class UsageMonitor {
       }
 
       // Group by service
-      if (!summary.byService[key.service]) {
-        summary.byService[key.service] = {
+      let service = summary.byService[key.service];
+      if (!service) {
+        service = summary.byService[key.service] = {
           totalKeys: 0,
           totalUsage: 0
         };
       }
-      summary.byService[key.service].totalKeys++;
-      summary.byService[key.service].totalUsage += key.usageCount || 0;
+      service.totalKeys++;
+      service.totalUsage += key.usageCount || 0;
 
       // Track unused keys
       if (!key.lastUsed) {
@@ -84,8 +89,6 @@ class UsageMonitor {
       } else {
         // Track recently used (last 7 days)
         const lastUsed = new Date(key.lastUsed);
-        const sevenDaysAgo = new Date();
-        sevenDaysAgo.setDate(sevenDaysAgo.getDate() - 7);
         
         if (lastUsed >= sevenDaysAgo) {
           summary.recentlyUsed.push({
@@ -112,26 +115,29 @@ class UsageMonitor {
     const cutoff = new Date();
     cutoff.setDate(cutoff.getDate() - period.days);
 
-    const history = (stats.usageHistory || []).filter(entry => {
-      return new Date(entry.timestamp) >= cutoff;
-    });
-
-    // Group by day
+    // Filter, group by day and collect actions in a single pass
     const byDay = {};
-    for (const entry of history) {
-      const date = entry.timestamp.split('T')[0];
-      if (!byDay[date]) {
-        byDay[date] = { count: 0, actions: {} };
+    const actions = new Set();
+    let totalUsage = 0;
+    for (const entry of stats.usageHistory || []) {
+      if (!(new Date(entry.timestamp) >= cutoff)) continue;
+      totalUsage++;
+      actions.add(entry.action);
+
+      const date = entry.timestamp.slice(0, 10); // YYYY-MM-DD prefix of the ISO timestamp
+      let day = byDay[date];
+      if (!day) {
+        day = byDay[date] = { count: 0, actions: {} };
       }
-      byDay[date].count++;
-      byDay[date].actions[entry.action] = (byDay[date].actions[entry.action] || 0) + 1;
+      day.count++;
+      day.actions[entry.action] = (day.actions[entry.action] || 0) + 1;
     }
 
     return {
       period: period.days,
-      totalUsage: history.length,
+      totalUsage,
       byDay,
-      uniqueActions: [...new Set(history.map(h => h.action))]
+      uniqueActions: [...actions]
     };
   }
 
@@ -152,18 +158,15 @@ class UsageMonitor {
 
     const anomalies = [];
     
-    // Calculate average usage
+    // Calculate average usage (parse each timestamp once and reuse below)
     const usageTimes = history.map(h => new Date(h.timestamp).getTime());
     const avgGap = (usageTimes[0] - usageTimes[usageTimes.length - 1]) / usageTimes.length;
     
     // Check for unusual frequency
-    const recentHistory = history.slice(-10);
+    const recentTimes = usageTimes.slice(-10);
     const recentGaps = [];
-    for (let i = 1; i < recentHistory.length; i++) {
-      recentGaps.push(
-        new Date(recentHistory[i - 1].timestamp).getTime() - 
-        new Date(recentHistory[i].timestamp).getTime()
-      );
+    for (let i = 1; i < recentTimes.length; i++) {
+      recentGaps.push(recentTimes[i - 1] - recentTimes[i]);
     }
     
     if (recentGaps.length > 0) {
@@ -178,9 +181,9 @@ class UsageMonitor {
     }
 
     // Check for irregular hours
-    const hours = recentHistory.map(h => new Date(h.timestamp).getHours());
+    const hours = recentTimes.map(t => new Date(t).getHours());
     const nightUsage = hours.filter(h => h >= 0 && h < 6).length;
-    if (nightUsage > recentHistory.length * 0.3) {
+    if (nightUsage > recentTimes.length * 0.3) {
       anomalies.push({
         type: 'unusual_hours',
         message: 'Significant usage during unusual hours (midnight-6am)'
@@ -204,8 +207,15 @@ class UsageMonitor {
    */
   async getHealthScore(keyId) {
     const key = await this.vault.getKeyMeta(keyId);
-    const stats = await this.vault.getKeyUsageStats(keyId);
-    
+    return this._scoreKey(key);
+  }
+
+  /**
+   * Score key metadata that has already been loaded
+   * @param {Object} key - Key metadata (as returned by listKeys/getKeyMeta)
+   * @param {Date} now - Reference time
+   */
+  _scoreKey(key, now = new Date()) {
     let score = 100;
     const issues = [];
 
@@ -216,7 +226,6 @@ class UsageMonitor {
     }
 
     // Check rotation status
-    const now = new Date();
     const nextRotation = new Date(key.nextRotation);
     const daysUntilRotation = Math.ceil((nextRotation - now) / (1000 * 60 * 60 * 24));
 
@@ -275,29 +284,32 @@ class UsageMonitor {
   async getVaultHealth() {
     const keys = await this.vault.listKeys();
     const healthScores = [];
+    const keysByStatus = { healthy: 0, warning: 0, critical: 0 };
+    let totalScore = 0;
+    const now = new Date();
 
+    // Single pass: collect scores, running total and status counts together.
+    // Score the metadata listKeys already returned rather than looking each key up again.
     for (const key of keys) {
-      const health = await this.getHealthScore(key.id);
+      const health = this._scoreKey(key, now);
       healthScores.push({
         id: key.id,
         name: key.name,
         ...health
       });
+      totalScore += health.score;
+      keysByStatus[health.status]++;
     }
 
     const avgScore = healthScores.length > 0
-      ? healthScores.reduce((sum, h) => sum + h.score, 0) / healthScores.length
+      ? totalScore / healthScores.length
       : 100;
 
     return {
       overallScore: Math.round(avgScore),
       status: avgScore >= 80 ? 'healthy' : avgScore >= 50 ? 'warning' : 'critical',
       keyCount: keys.length,
-      keysByStatus: {
-        healthy: healthScores.filter(h => h.status === 'healthy').length,
-        warning: healthScores.filter(h => h.status === 'warning').length,
-        critical: healthScores.filter(h => h.status === 'critical').length
-      },
+      keysByStatus,
       keys: healthScores
     };
   }
@@ -4,6 +4,8 @@
 
 const crypto = require('../utils/crypto');
 
+const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
 class RotationService {
   constructor(vault, auditLogger) {
     this.vault = vault;
@@ -33,6 +35,19 @@ class RotationService {
     // Perform rotation
     const result = await this.vault.rotateKey(keyId, newKey);
     
+    await this._afterRotation(result, currentKey.keyHash, reason, notify);
+
+    return result;
+  }
+
+  /**
+   * Audit and notify handlers about a completed rotation
+   * @param {Object} result - Rotation result from the vault
+   * @param {string} previousKeyHash - Hash of the replaced key value
+   * @param {string} reason - Rotation reason
+   * @param {boolean} notify - Whether to call rotation handlers
+   */
+  async _afterRotation(result, previousKeyHash, reason, notify) {
     // Log the rotation
     await this.auditLogger.logKeyRotated({
       id: result.id,
@@ -49,7 +64,7 @@ class RotationService {
             keyId: result.id,
             name: result.name,
             newKey: result.key,
-            previousKeyId: currentKey.keyHash,
+            previousKeyId: previousKeyHash,
             reason,
             rotatedAt: result.lastRotated,
             nextRotation: result.nextRotation
@@ -59,8 +74,6 @@ class RotationService {
         }
       }
     }
-
-    return result;
   }
 
   /**
@@ -78,20 +91,14 @@ class RotationService {
       skipped: []
     };
 
-    for (const key of keysNeedingRotation) {
-      try {
+    if (dryRun || !autoRotate) {
+      for (const key of keysNeedingRotation) {
         if (dryRun) {
           results.skipped.push({
             id: key.id,
             name: key.name,
             reason: 'dry run'
           });
-          continue;
-        }
-
-        if (autoRotate) {
-          const result = await this.rotateKey(key.id, { reason: 'scheduled' });
-          results.rotated.push(result);
         } else {
           results.skipped.push({
             id: key.id,
@@ -100,6 +107,30 @@ class RotationService {
             reason: 'auto-rotate disabled'
           });
         }
+      }
+      return results;
+    }
+
+    // Rotate every due key in one batch so the vault is written once
+    let rotated;
+    try {
+      rotated = await this.vault.rotateKeys(keysNeedingRotation.map(key => key.id));
+    } catch (e) {
+      for (const key of keysNeedingRotation) {
+        results.failed.push({
+          id: key.id,
+          name: key.name,
+          error: e.message
+        });
+      }
+      return results;
+    }
+
+    for (let i = 0; i < rotated.length; i++) {
+      const key = keysNeedingRotation[i];
+      try {
+        await this._afterRotation(rotated[i], key.keyHash, 'scheduled', true);
+        results.rotated.push(rotated[i]);
       } catch (e) {
         results.failed.push({
           id: key.id,
@@ -120,8 +151,7 @@ class RotationService {
     const now = new Date();
 
     return keys.map(key => {
-      const nextRotation = new Date(key.nextRotation);
-      const daysUntilRotation = Math.ceil((nextRotation - now) / (1000 * 60 * 60 * 24));
+      const daysUntilRotation = this._daysUntilRotation(key, now);
       
       return {
         id: key.id,
@@ -195,17 +225,17 @@ class RotationService {
         continue;
       }
 
-      const nextRotation = new Date(key.nextRotation);
-      const daysUntil = Math.ceil((nextRotation - now) / (1000 * 60 * 60 * 24));
+      const daysUntil = this._daysUntilRotation(key, now);
 
       // Group by service
-      if (!report.byService[key.service]) {
-        report.byService[key.service] = {
+      let service = report.byService[key.service];
+      if (!service) {
+        service = report.byService[key.service] = {
           total: 0,
           needsRotation: 0
         };
       }
-      report.byService[key.service].total++;
+      service.total++;
 
       // Group by rotation status
       if (daysUntil <= 0) {
@@ -216,7 +246,7 @@ class RotationService {
           service: key.service,
           daysOverdue: Math.abs(daysUntil)
         });
-        report.byService[key.service].needsRotation++;
+        service.needsRotation++;
       } else if (daysUntil <= 7) {
         report.keysHealthy++;
         report.byRotationStatus.dueSoon.push({
@@ -238,6 +268,15 @@ class RotationService {
 
     return report;
   }
+
+  /**
+   * Whole days until a key's next rotation (negative when overdue)
+   * @param {Object} key - Key metadata
+   * @param {Date} now - Reference time
+   */
+  _daysUntilRotation(key, now) {
+    return Math.ceil((new Date(key.nextRotation) - now) / MS_PER_DAY);
+  }
 }
 
 module.exports = RotationService;
@@ -20,6 +20,7 @@ class VaultStorage {
     };
     this.encryptionKey = null;
     this.isUnlocked = false;
+    this.keyIndex = new Map(); // id -> key record, kept in sync with data.keys
   }
 
   /**
@@ -38,9 +39,11 @@ class VaultStorage {
     this.encryptionKey = key;
     
     // Initialize vault metadata
-    this.data.metadata.createdAt = new Date().toISOString();
-    this.data.metadata.updatedAt = new Date().toISOString();
+    const now = new Date().toISOString();
+    this.data.metadata.createdAt = now;
+    this.data.metadata.updatedAt = now;
     this.data.metadata.salt = salt;
+    this._rebuildIndex();
     
     await this.save();
     this.isUnlocked = true;
@@ -85,6 +88,7 @@ class VaultStorage {
   async load() {
     const raw = fs.readFileSync(this.vaultPath, 'utf8');
     this.data = JSON.parse(raw);
+    this._rebuildIndex();
     return this.data;
   }
 
@@ -120,6 +124,7 @@ class VaultStorage {
   async addKey(keyData) {
     this._ensureUnlocked();
     
+    const now = new Date().toISOString();
     const key = {
       id: crypto.generateApiKey(16),
       name: keyData.name,
@@ -127,10 +132,10 @@ class VaultStorage {
       key: crypto.encrypt(keyData.key, this.encryptionKey),
       keyHash: crypto.hash(keyData.key), // For verification without decryption
       rotationDays: keyData.rotationDays || 90,
-      lastRotated: new Date().toISOString(),
-      nextRotation: this._calculateNextRotation(keyData.rotationDays || 90),
-      createdAt: new Date().toISOString(),
-      updatedAt: new Date().toISOString(),
+      lastRotated: now,
+      nextRotation: this._calculateNextRotation(keyData.rotationDays || 90, now),
+      createdAt: now,
+      updatedAt: now,
       enabled: true,
       tags: keyData.tags || [],
       metadata: keyData.metadata || {},
@@ -139,7 +144,8 @@ class VaultStorage {
     };
 
     this.data.keys.push(key);
-    this.data.metadata.updatedAt = new Date().toISOString();
+    this.keyIndex.set(key.id, key);
+    this.data.metadata.updatedAt = now;
     await this.save();
 
     return {
@@ -159,10 +165,7 @@ class VaultStorage {
   async getKey(id) {
     this._ensureUnlocked();
     
-    const key = this.data.keys.find(k => k.id === id);
-    if (!key) {
-      throw new Error('Key not found');
-    }
+    const key = this._findKey(id);
 
     return {
       id: key.id,
@@ -190,10 +193,7 @@ class VaultStorage {
   async getKeyMeta(id) {
     this._ensureUnlocked();
     
-    const key = this.data.keys.find(k => k.id === id);
-    if (!key) {
-      throw new Error('Key not found');
-    }
+    const key = this._findKey(id);
 
     // Return everything except the actual key
     const { key: _, ...meta } = key;
@@ -220,19 +220,15 @@ class VaultStorage {
   async updateKey(id, updates) {
     this._ensureUnlocked();
     
-    const index = this.data.keys.findIndex(k => k.id === id);
-    if (index === -1) {
-      throw new Error('Key not found');
-    }
-
-    const key = this.data.keys[index];
+    const key = this._findKey(id);
+    const now = new Date().toISOString();
 
     // Update allowed fields
     if (updates.name) key.name = updates.name;
     if (updates.service) key.service = updates.service;
     if (updates.rotationDays) {
       key.rotationDays = updates.rotationDays;
-      key.nextRotation = this._calculateNextRotation(updates.rotationDays);
+      key.nextRotation = this._calculateNextRotation(updates.rotationDays, now);
     }
     if (updates.enabled !== undefined) key.enabled = updates.enabled;
     if (updates.tags) key.tags = updates.tags;
@@ -244,8 +240,8 @@ class VaultStorage {
       key.keyHash = crypto.hash(updates.key);
     }
 
-    key.updatedAt = new Date().toISOString();
-    this.data.metadata.updatedAt = new Date().toISOString();
+    key.updatedAt = now;
+    this.data.metadata.updatedAt = now;
     await this.save();
 
     return { success: true, message: 'Key updated successfully' };
@@ -258,12 +254,10 @@ class VaultStorage {
   async deleteKey(id) {
     this._ensureUnlocked();
     
-    const index = this.data.keys.findIndex(k => k.id === id);
-    if (index === -1) {
-      throw new Error('Key not found');
-    }
+    const key = this._findKey(id);
 
-    this.data.keys.splice(index, 1);
+    this.data.keys.splice(this.data.keys.indexOf(key), 1);
+    this.keyIndex.delete(id);
     this.data.metadata.updatedAt = new Date().toISOString();
     await this.save();
 
@@ -278,29 +272,53 @@ class VaultStorage {
   async rotateKey(id, newKey = null) {
     this._ensureUnlocked();
     
-    const key = this.data.keys.find(k => k.id === id);
-    if (!key) {
-      throw new Error('Key not found');
-    }
-
-    const generatedKey = newKey || crypto.generateApiKey(32);
-    
-    key.key = crypto.encrypt(generatedKey, this.encryptionKey);
-    key.keyHash = crypto.hash(generatedKey);
-    key.lastRotated = new Date().toISOString();
-    key.nextRotation = this._calculateNextRotation(key.rotationDays);
-    key.updatedAt = new Date().toISOString();
+    const key = this._findKey(id);
+    const now = new Date().toISOString();
+    const result = this._rotateRecord(key, newKey, now);
     
-    this.data.metadata.updatedAt = new Date().toISOString();
+    this.data.metadata.updatedAt = now;
     await this.save();
 
-    return {
-      id: key.id,
-      name: key.name,
-      key: generatedKey,
+    return result;
+  }
+
+  /**
+   * Rotate several API keys with generated values, writing the vault once
+   * @param {string[]} ids - Key IDs
+   */
+  async rotateKeys(ids) {
+    this._ensureUnlocked();
+
+    // Resolve every ID before mutating so an unknown ID rotates nothing
+    const keys = ids.map(id => this._findKey(id));
+    if (keys.length === 0) {
+      return [];
+    }
+
+    // Snapshot the fields rotation touches so a failed write can be rolled back;
+    // otherwise a later save would persist values no caller ever received
+    const previous = keys.map(key => ({
+      key: key.key,
+      keyHash: key.keyHash,
       lastRotated: key.lastRotated,
-      nextRotation: key.nextRotation
-    };
+      nextRotation: key.nextRotation,
+      updatedAt: key.updatedAt
+    }));
+    const previousUpdatedAt = this.data.metadata.updatedAt;
+
+    const now = new Date().toISOString();
+    try {
+      const results = keys.map(key => this._rotateRecord(key, null, now));
+
+      this.data.metadata.updatedAt = now;
+      await this.save();
+
+      return results;
+    } catch (e) {
+      keys.forEach((key, i) => Object.assign(key, previous[i]));
+      this.data.metadata.updatedAt = previousUpdatedAt;
+      throw e;
+    }
   }
 
   /**
@@ -311,13 +329,11 @@ class VaultStorage {
   async recordUsage(id, usageInfo = {}) {
     this._ensureUnlocked();
     
-    const key = this.data.keys.find(k => k.id === id);
-    if (!key) {
-      throw new Error('Key not found');
-    }
+    const key = this._findKey(id);
 
+    const now = new Date().toISOString();
     key.usageCount = (key.usageCount || 0) + 1;
-    key.lastUsed = new Date().toISOString();
+    key.lastUsed = now;
     
     // Store usage metadata
     if (!key.usageHistory) {
@@ -325,17 +341,17 @@ class VaultStorage {
     }
     
     key.usageHistory.push({
-      timestamp: new Date().toISOString(),
+      timestamp: now,
       action: usageInfo.action || 'access',
       metadata: usageInfo.metadata || {}
     });
 
-    // Keep only last 100 usage records
+    // Keep only last 100 usage records (trimmed in place, no copy per call)
     if (key.usageHistory.length > 100) {
-      key.usageHistory = key.usageHistory.slice(-100);
+      key.usageHistory.splice(0, key.usageHistory.length - 100);
     }
 
-    this.data.metadata.updatedAt = new Date().toISOString();
+    this.data.metadata.updatedAt = now;
     await this.save();
 
     return { success: true, usageCount: key.usageCount };
@@ -348,14 +364,14 @@ class VaultStorage {
     this._ensureUnlocked();
     
     const now = new Date();
-    return this.data.keys.filter(key => {
-      if (!key.enabled) return false;
-      const nextRotation = new Date(key.nextRotation);
-      return nextRotation <= now;
-    }).map(key => {
+    const due = [];
+    for (const key of this.data.keys) {
+      if (!key.enabled) continue;
+      if (!(new Date(key.nextRotation) <= now)) continue;
       const { key: _, ...meta } = key;
-      return meta;
-    });
+      due.push(meta);
+    }
+    return due;
   }
 
   /**
@@ -365,10 +381,7 @@ class VaultStorage {
   async getKeyUsageStats(id) {
     this._ensureUnlocked();
     
-    const key = this.data.keys.find(k => k.id === id);
-    if (!key) {
-      throw new Error('Key not found');
-    }
+    const key = this._findKey(id);
 
     return {
       id: key.id,
@@ -379,16 +392,60 @@ class VaultStorage {
     };
   }
 
+  /**
+   * Replace a key record's value in memory (caller is responsible for saving)
+   * @param {Object} key - Key record
+   * @param {string} newKey - New key value (generated if not provided)
+   * @param {string} now - ISO timestamp for the rotation
+   */
+  _rotateRecord(key, newKey, now) {
+    const generatedKey = newKey || crypto.generateApiKey(32);
+
+    key.key = crypto.encrypt(generatedKey, this.encryptionKey);
+    key.keyHash = crypto.hash(generatedKey);
+    key.lastRotated = now;
+    key.nextRotation = this._calculateNextRotation(key.rotationDays, now);
+    key.updatedAt = now;
+
+    return {
+      id: key.id,
+      name: key.name,
+      key: generatedKey,
+      lastRotated: key.lastRotated,
+      nextRotation: key.nextRotation
+    };
+  }
+
   /**
    * Calculate next rotation date
    * @param {number} days - Rotation period in days
+   * @param {string|Date} from - Start of the period (defaults to now)
    */
-  _calculateNextRotation(days) {
-    const date = new Date();
+  _calculateNextRotation(days, from = new Date()) {
+    const date = new Date(from);
     date.setDate(date.getDate() + days);
     return date.toISOString();
   }
 
+  /**
+   * Look up a key record by ID via the index
+   * @param {string} id - Key ID
+   */
+  _findKey(id) {
+    const key = this.keyIndex.get(id);
+    if (!key) {
+      throw new Error('Key not found');
+    }
+    return key;
+  }
+
+  /**
+   * Rebuild the ID index from the loaded key list
+   */
+  _rebuildIndex() {
+    this.keyIndex = new Map(this.data.keys.map(key => [key.id, key]));
+  }
+
   /**
    * Ensure vault is unlocked
    */
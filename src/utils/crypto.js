@@ -3,8 +3,10 @@
  * Uses AES-256-CTR for encryption with a master key derived from PBKDF2
  */
 
-const aesjs = require('aes-js');
 const crypto = require('crypto');
+const { promisify } = require('util');
+
+const pbkdf2 = promisify(crypto.pbkdf2);
 
 class Crypto {
   constructor() {
@@ -24,9 +26,10 @@ class Crypto {
       salt = crypto.randomBytes(16).toString('hex');
     }
     
-    // Use PBKDF2 to derive a proper 32-byte key
+    // Use PBKDF2 to derive a proper 32-byte key. The async variant runs on the
+    // libuv thread pool, so derivation no longer blocks the event loop.
     const saltBuffer = Buffer.from(salt, 'hex');
-    const key = crypto.pbkdf2Sync(passphrase, saltBuffer, 100000, this.keyLength, 'sha256');
+    const key = await pbkdf2(passphrase, saltBuffer, this.pbkdf2Iterations, this.keyLength, 'sha256');
     
     return { key, salt };
   }
@@ -41,8 +44,9 @@ class Crypto {
     // Generate a random IV using Node's crypto
     const iv = crypto.randomBytes(this.ivLength);
     
-    const aesCtr = new aesjs.ModeOfOperation.ctr(key, new aesjs.Counter(iv));
-    const encryptedBytes = aesCtr.encrypt(aesjs.utils.utf8.toBytes(plaintext));
+    // Native (OpenSSL) AES-256-CTR; the IV is the initial 128-bit counter block
+    const cipher = crypto.createCipheriv('aes-256-ctr', key, iv);
+    const encryptedBytes = Buffer.concat([cipher.update(plaintext, 'utf8'), cipher.final()]);
     
     // Prepend IV to encrypted data
     const combined = Buffer.concat([iv, encryptedBytes]);
@@ -59,13 +63,13 @@ class Crypto {
     const combined = Buffer.from(ciphertext, 'base64');
     
     // Extract IV and encrypted data
-    const iv = combined.slice(0, this.ivLength);
-    const encryptedBytes = combined.slice(this.ivLength);
+    const iv = combined.subarray(0, this.ivLength);
+    const encryptedBytes = combined.subarray(this.ivLength);
     
-    const aesCtr = new aesjs.ModeOfOperation.ctr(key, new aesjs.Counter(iv));
-    const decryptedBytes = aesCtr.decrypt(encryptedBytes);
+    const decipher = crypto.createDecipheriv('aes-256-ctr', key, iv);
+    const decryptedBytes = Buffer.concat([decipher.update(encryptedBytes), decipher.final()]);
     
-    return aesjs.utils.utf8.fromBytes(decryptedBytes);
+    return decryptedBytes.toString('utf8');
   }
 
   /**
@@ -85,11 +89,8 @@ class Crypto {
    */
   generateApiKey(length = 32) {
     const bytes = crypto.randomBytes(length);
-    // Convert to base64url format for URL-safe keys
-    return bytes.toString('base64')
-      .replace(/\+/g, '-')
-      .replace(/\//g, '_')
-      .replace(/=/g, '');
+    // Encode as base64url (URL-safe, unpadded) in a single native pass
+    return bytes.toString('base64url');
   }
 
   /**
@@ -38,6 +38,14 @@ describe('Crypto Utils', () => {
     
     expect(decrypted).toBe(plaintext);
   });
+
+  test('should decrypt IV-prefixed AES-256-CTR ciphertext', () => {
+    // Key and IV from NIST SP 800-38A F.5.5 (CTR-AES256)
+    const key = Buffer.from('603deb1015ca71be2b73aef0857d77811f352c073b6108d72d9810a30914dff4', 'hex');
+    const ciphertext = '8PHy8/T19vf4+fr7/P3+/3i6HoM8YztSLvOmfq0Z5CM=';
+
+    expect(crypto.decrypt(ciphertext, key)).toBe('secret-api-key!!');
+  });
 });
 
 describe('Vault Storage', () => {
@@ -126,6 +134,22 @@ describe('Vault Storage', () => {
     
     const keys = await vault.listKeys();
     expect(keys.length).toBe(0);
+    await expect(vault.getKey(added.id)).rejects.toThrow('Key not found');
+  });
+
+  test('should find keys after reopening the vault', async () => {
+    await vault.init('test-passphrase');
+
+    const added = await vault.addKey({
+      name: 'Test Key',
+      key: 'api-key-value'
+    });
+
+    const reopened = new VaultStorage(TEST_VAULT_PATH);
+    await reopened.unlock('test-passphrase');
+
+    const retrieved = await reopened.getKey(added.id);
+    expect(retrieved.key).toBe('api-key-value');
   });
 
   test('should rotate a key', async () => {
@@ -141,6 +165,51 @@ describe('Vault Storage', () => {
     expect(rotated.lastRotated).toBeDefined();
   });
 
+  test('should rotate several keys in one batch', async () => {
+    await vault.init('test-passphrase');
+
+    const first = await vault.addKey({ name: 'Key 1', key: 'old-key-1' });
+    const second = await vault.addKey({ name: 'Key 2', key: 'old-key-2' });
+
+    const rotated = await vault.rotateKeys([first.id, second.id]);
+    expect(rotated.map(r => r.id)).toEqual([first.id, second.id]);
+
+    const retrieved = await vault.getKey(second.id);
+    expect(retrieved.key).toBe(rotated[1].key);
+    expect(retrieved.key).not.toBe('old-key-2');
+
+    await expect(vault.rotateKeys([first.id, 'missing'])).rejects.toThrow('Key not found');
+  });
+
+  test('should keep original keys when a batch rotation fails to save', async () => {
+    await vault.init('test-passphrase');
+
+    const first = await vault.addKey({ name: 'Key 1', key: 'old-key-1' });
+    const second = await vault.addKey({ name: 'Key 2', key: 'old-key-2' });
+    const before = await vault.getKeyMeta(first.id);
+
+    vault.save = () => Promise.reject(new Error('EIO'));
+    await expect(vault.rotateKeys([first.id, second.id])).rejects.toThrow('EIO');
+
+    expect((await vault.getKey(first.id)).key).toBe('old-key-1');
+    expect((await vault.getKey(second.id)).key).toBe('old-key-2');
+    const after = await vault.getKeyMeta(first.id);
+    expect(after.lastRotated).toBe(before.lastRotated);
+    expect(after.nextRotation).toBe(before.nextRotation);
+  });
+
+  test('should not report keys without a rotation date as due', async () => {
+    await vault.init('test-passphrase');
+
+    const overdue = await vault.addKey({ name: 'Overdue', key: 'key1' });
+    await vault.addKey({ name: 'Undated', key: 'key2' });
+    vault.data.keys[0].nextRotation = new Date(Date.now() - 1000).toISOString();
+    delete vault.data.keys[1].nextRotation;
+
+    const due = await vault.getKeysNeedingRotation();
+    expect(due.map(k => k.id)).toEqual([overdue.id]);
+  });
+
   test('should record usage', async () => {
     await vault.init('test-passphrase');
     